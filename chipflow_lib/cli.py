@@ -2,19 +2,23 @@
 
 import os
 import sys
+import pickle
+import hashlib
 import inspect
 import importlib
 import argparse
-import tomli
-import jsonschema
+import functools
 
 from . import ChipFlowError
 
 
+@functools.lru_cache(maxsize=None)
 def _get_cls_by_reference(reference, context):
     module_ref, _, class_ref = reference.partition(":")
+    module_obj = sys.modules.get(module_ref)
     try:
-        module_obj = importlib.import_module(module_ref)
+        if module_obj is None:
+            module_obj = importlib.import_module(module_ref)
     except ModuleNotFoundError as e:
         raise ChipFlowError(f"Module `{module_ref}` referenced by {context} is not found")
     try:
@@ -25,11 +29,10 @@ def _get_cls_by_reference(reference, context):
 
 
 def _ensure_chipflow_root():
-    if "CHIPFLOW_ROOT" not in os.environ:
-        os.environ["CHIPFLOW_ROOT"] = os.getcwd()
-    if os.environ["CHIPFLOW_ROOT"] not in sys.path:
-        sys.path.append(os.environ["CHIPFLOW_ROOT"])
-    return os.environ["CHIPFLOW_ROOT"]
+    chipflow_root = os.environ.setdefault("CHIPFLOW_ROOT", os.getcwd())
+    if chipflow_root not in sys.path:
+        sys.path.append(chipflow_root)
+    return chipflow_root
 
 
 config_schema = {
@@ -120,45 +123,111 @@ config_schema = {
     }
 }
 
+# Built on first use, since a cached config does not need to be validated again.
+_config_validator = None
+
 
 def _parse_config():
     chipflow_root = _ensure_chipflow_root()
     config_file = f"{chipflow_root}/chipflow.toml"
-    return _parse_config_file(config_file)
 
+    # Reuse the config validated by a previous invocation if neither it nor the schema has changed.
+    config_stat = os.stat(config_file)
+    cache_key = (config_stat.st_mtime_ns, config_stat.st_size, config_schema)
+    cache_file = os.path.join(chipflow_root, "build", "chipflow.toml.pickle")
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, cached_config_dict = pickle.load(f)
+        if cached_key == cache_key:
+            return cached_config_dict
+    except Exception:
+        pass  # missing or unreadable cache, parse the config again
 
-def _parse_config_file(config_file):
-    with open(config_file, "rb") as f:
-        config_dict = tomli.load(f)
+    config_dict = _parse_config_file(config_file)
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file + ".tmp", "wb") as f:
+            pickle.dump((cache_key, config_dict), f)
+        os.replace(cache_file + ".tmp", cache_file)
+    except OSError:
+        pass  # the cache is an optimization only
+    return config_dict
+
+
+# Maps the absolute path of each parsed config file to its (mtime, size), content digest and contents.
+_config_cache = {}
 
+
+def _parse_config_file(config_file):
+    config_path = os.path.abspath(config_file)
+    config_stat = os.stat(config_path)
+    config_stamp = (config_stat.st_mtime_ns, config_stat.st_size)
+    cached_stamp, cached_digest, cached_config_dict = _config_cache.get(config_path, (None, None, None))
+    if cached_stamp == config_stamp:
+        return cached_config_dict
+
+    with open(config_path, "rb") as f:
+        config_data = f.read()
+    # A file that was touched or rewritten without changing its contents does not need re-parsing.
+    config_digest = hashlib.sha256(config_data).digest()
+    if cached_digest == config_digest:
+        _config_cache[config_path] = (config_stamp, config_digest, cached_config_dict)
+        return cached_config_dict
+
+    # These are only needed when the config has to be parsed, so keep them off the startup path.
+    import jsonschema
     try:
-        jsonschema.validate(config_dict, config_schema)
-        return config_dict
-    except jsonschema.ValidationError as e:
-        raise ChipFlowError(f"Syntax error in `chipflow.toml` at `{'.'.join(e.path)}`: {e.message}")
+        import tomllib
+    except ImportError:
+        import tomli as tomllib
+
+    global _config_validator
+    if _config_validator is None:
+        _config_validator = jsonschema.Draft202012Validator(config_schema)
+
+    config_dict = tomllib.loads(config_data.decode("utf-8"))
+
+    error = jsonschema.exceptions.best_match(_config_validator.iter_errors(config_dict))
+    if error is not None:
+        raise ChipFlowError(f"Syntax error in `chipflow.toml` at `{'.'.join(error.path)}`: "
+                            f"{error.message}")
+
+    _config_cache[config_path] = (config_stamp, config_digest, config_dict)
+    return config_dict
 
 
 def run(argv=sys.argv[1:]):
     config = _parse_config()
 
+    # Only the step being run needs to be initialized.
+    step_references = config["chipflow"]["steps"]
+    requested_step = next((arg for arg in argv if not arg.startswith("-")), None)
+
     steps = {}
-    for step_name, step_reference in config["chipflow"]["steps"].items():
-        step_cls = _get_cls_by_reference(step_reference, context=f"step `{step_name}`")
+    if requested_step in step_references:
+        step_reference = step_references[requested_step]
+        step_cls = _get_cls_by_reference(step_reference, context=f"step `{requested_step}`")
         try:
-            steps[step_name] = step_cls(config)
+            steps[requested_step] = step_cls(config)
         except Exception:
-            raise ChipFlowError(f"Encountered error while initializing step `{step_name}` "
+            raise ChipFlowError(f"Encountered error while initializing step `{requested_step}` "
                                 f"using `{step_reference}`")
 
     parser = argparse.ArgumentParser()
     step_argument = parser.add_subparsers(dest="step", required=True)
-    for step_name, step_cls in steps.items():
-        step_subparser = step_argument.add_parser(step_name, help=inspect.getdoc(step_cls))
+    for step_name, step in steps.items():
+        step_subparser = step_argument.add_parser(step_name, help=inspect.getdoc(step))
         try:
-            step_cls.build_cli_parser(step_subparser)
+            step.build_cli_parser(step_subparser)
         except Exception:
             raise ChipFlowError(f"Encountered error while building CLI argument parser for "
                                 f"step `{step_name}`")
+    if not steps:
+        # Without a step to run, argparse will only print help or a usage error, so list every step
+        # without initializing any of them.
+        for step_name, step_reference in step_references.items():
+            step_cls = _get_cls_by_reference(step_reference, context=f"step `{step_name}`")
+            step_argument.add_parser(step_name, help=inspect.getdoc(step_cls))
 
     args = parser.parse_args(argv)
     try:
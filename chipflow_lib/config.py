@@ -1,10 +1,13 @@
 # SPDX-License-Identifier: BSD-2-Clause
 import os
+import functools
 
 
+@functools.cache
 def get_dir_models():
     return os.path.dirname(__file__) + "/models"
 
 
+@functools.cache
 def get_dir_software():
     return os.path.dirname(__file__) + "/software"
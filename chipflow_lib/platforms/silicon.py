@@ -1,7 +1,9 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 import os
+import hashlib
 import subprocess
+import importlib.metadata
 
 from amaranth import *
 from amaranth.lib import io
@@ -240,6 +242,17 @@ class SiliconPlatform:
         # Prepare design for RTLIL conversion.
         return fragment.prepare(ports)
 
+    @staticmethod
+    def _build_hash(link_script_content):
+        try:
+            yosys_version = importlib.metadata.version("yowasp-yosys")
+        except importlib.metadata.PackageNotFoundError:
+            yosys_version = None
+        hasher = hashlib.sha256()
+        hasher.update(f"yowasp-yosys=={yosys_version}\n".encode("utf-8"))
+        hasher.update(link_script_content)
+        return hasher.hexdigest()
+
     def build(self, elaboratable, name="top"):
         fragment = self._prepare(elaboratable, name)
         rtlil_text, _ = rtlil.convert_fragment(fragment, name)
@@ -266,12 +279,34 @@ class SiliconPlatform:
         os.makedirs(build_dir, exist_ok=True)
 
         link_script = os.path.join(build_dir, name + "_link.ys")
-        with open(link_script, "wb") as script_fp:
-            script_fp.write(b"\n".join(yosys_script))
+        link_script_content = b"\n".join(yosys_script)
         output_rtlil = os.path.join(build_dir, name + ".il")
+
+        # Skip re-running Yosys if neither the design nor the toolchain changed since the last build
+        build_hash = self._build_hash(link_script_content)
+        build_hash_file = output_rtlil + ".buildhash"
+        if "CHIPFLOW_FORCE_REBUILD" not in os.environ and os.path.exists(output_rtlil):
+            try:
+                with open(build_hash_file) as hash_fp:
+                    if hash_fp.read() == build_hash:
+                        return output_rtlil
+            except FileNotFoundError:
+                pass
+
+        # The previous output is about to be overwritten, so it must not be reused if this build fails.
+        try:
+            os.remove(build_hash_file)
+        except FileNotFoundError:
+            pass
+
+        with open(link_script, "wb") as script_fp:
+            script_fp.write(link_script_content)
         subprocess.check_call([
             # yowasp supports forward slashes *only*
             "yowasp-yosys", "-q", link_script.replace("\\", "/"),
             "-o", output_rtlil.replace("\\", "/")
         ])
+        with open(build_hash_file + ".tmp", "w") as hash_fp:
+            hash_fp.write(build_hash)
+        os.replace(build_hash_file + ".tmp", build_hash_file)
         return output_rtlil
@@ -21,31 +21,23 @@ class QSPIFlashProvider(Elaboratable):
         m = Module()
 
         flash = platform.request("spi_flash", dir=dict(cs='-', copi='-', cipo='-', wp='-', hold='-'))
+        rst = ResetSignal()
         # Flash clock requires a special primitive to access in ECP5
         m.submodules.usrmclk = Instance(
             "USRMCLK",
             i_USRMCLKI=self.pins.clk_o,
-            i_USRMCLKTS=ResetSignal(),  # tristate in reset for programmer accesss
+            i_USRMCLKTS=rst,  # tristate in reset for programmer accesss
             a_keep=1,
         )
-        # IO pins and buffers
-        m.submodules += Instance(
-            "OBZ",
-            o_O=flash.cs.io,
-            i_I=self.pins.csn_o,
-            i_T=ResetSignal(),
-        )
-        # Pins in order
-        data_pins = ["copi", "cipo", "wp", "hold"]
-
-        for i in range(4):
-            m.submodules += Instance(
-                "BB",
-                io_B=getattr(flash, data_pins[i]).io,
-                i_I=self.pins.d_o[i],
-                i_T=~self.pins.d_oe[i],
-                o_O=self.pins.d_i[i]
-            )
+        # IO pins and buffers; data pins in order: copi, cipo, wp, hold
+        d_t = ~self.pins.d_oe
+        m.submodules += [
+            Instance("OBZ", o_O=flash.cs.io, i_I=self.pins.csn_o, i_T=rst),
+            Instance("BB", io_B=flash.copi.io, i_I=self.pins.d_o[0], i_T=d_t[0], o_O=self.pins.d_i[0]),
+            Instance("BB", io_B=flash.cipo.io, i_I=self.pins.d_o[1], i_T=d_t[1], o_O=self.pins.d_i[1]),
+            Instance("BB", io_B=flash.wp.io,   i_I=self.pins.d_o[2], i_T=d_t[2], o_O=self.pins.d_i[2]),
+            Instance("BB", io_B=flash.hold.io, i_I=self.pins.d_o[3], i_T=d_t[3], o_O=self.pins.d_i[3]),
+        ]
         return m
 
 
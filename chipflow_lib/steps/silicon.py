@@ -4,7 +4,6 @@ import os
 import sys
 import time
 import json
-import pprint
 import inspect
 import argparse
 import subprocess
@@ -0,0 +1,240 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+import io
+import os
+import sys
+import shutil
+import types
+import tempfile
+import unittest
+import jsonschema
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from chipflow_lib import ChipFlowError
+from chipflow_lib.cli import (_get_cls_by_reference, _ensure_chipflow_root, _parse_config, _parse_config_file,
+                              config_schema, run)
+from chipflow_lib.steps.silicon import SiliconStep
+
+
+current_dir = os.path.dirname(__file__)
+
+
+class MockStep:
+    """Run the mock step."""
+
+    runs = []
+
+    def __init__(self, config):
+        pass
+
+    def build_cli_parser(self, parser):
+        parser.add_argument("--flag", default=False, action="store_true")
+
+    def run_cli(self, args):
+        self.runs.append(args)
+
+
+class GetClsByReferenceTestCase(unittest.TestCase):
+    def test_resolves_class(self):
+        cls = _get_cls_by_reference("chipflow_lib.steps.silicon:SiliconStep", context="step `silicon`")
+        self.assertIs(cls, SiliconStep)
+
+    def test_resolution_is_cached(self):
+        module = types.ModuleType("chipflow_test_cached_module")
+        module.Step = type("Step", (), {})
+        self.assertNotIn(module.__name__, sys.modules)
+        with patch("importlib.import_module", return_value=module) as mock_import_module:
+            first_cls = _get_cls_by_reference(f"{module.__name__}:Step", context="step `cached`")
+            second_cls = _get_cls_by_reference(f"{module.__name__}:Step", context="step `cached`")
+        self.assertIs(first_cls, module.Step)
+        self.assertIs(second_cls, module.Step)
+        mock_import_module.assert_called_once_with(module.__name__)
+
+    def test_loaded_module_skips_import(self):
+        module = types.ModuleType("chipflow_test_loaded_module")
+        module.Step = type("Step", (), {})
+        with patch.dict(sys.modules, {module.__name__: module}), \
+                patch("importlib.import_module") as mock_import_module:
+            cls = _get_cls_by_reference(f"{module.__name__}:Step", context="step `loaded`")
+        self.assertIs(cls, module.Step)
+        mock_import_module.assert_not_called()
+
+    def test_module_not_found(self):
+        with self.assertRaisesRegex(
+                ChipFlowError,
+                r"^Module `chipflow_lib.nonexistent` referenced by step `foo` is not found$"):
+            _get_cls_by_reference("chipflow_lib.nonexistent:Foo", context="step `foo`")
+
+    def test_class_not_found(self):
+        with self.assertRaisesRegex(
+                ChipFlowError,
+                r"^Module `chipflow_lib.steps.silicon` referenced by step `foo` does not define `Foo`$"):
+            _get_cls_by_reference("chipflow_lib.steps.silicon:Foo", context="step `foo`")
+
+
+class EnsureChipflowRootTestCase(unittest.TestCase):
+    def test_root_added_to_path_once(self):
+        with tempfile.TemporaryDirectory() as chipflow_root, \
+                patch.dict(os.environ, {"CHIPFLOW_ROOT": chipflow_root}), \
+                patch.object(sys, "path", list(sys.path)):
+            self.assertEqual(_ensure_chipflow_root(), chipflow_root)
+            self.assertEqual(_ensure_chipflow_root(), chipflow_root)
+            self.assertEqual(sys.path.count(chipflow_root), 1)
+
+    def test_changed_root_is_picked_up(self):
+        with tempfile.TemporaryDirectory() as first_root, \
+                tempfile.TemporaryDirectory() as second_root, \
+                patch.dict(os.environ, {"CHIPFLOW_ROOT": first_root}), \
+                patch.object(sys, "path", list(sys.path)):
+            self.assertEqual(_ensure_chipflow_root(), first_root)
+            os.environ["CHIPFLOW_ROOT"] = second_root
+            self.assertEqual(_ensure_chipflow_root(), second_root)
+            self.assertIn(second_root, sys.path)
+
+    def test_root_restored_after_path_reset(self):
+        with tempfile.TemporaryDirectory() as chipflow_root, \
+                patch.dict(os.environ, {"CHIPFLOW_ROOT": chipflow_root}):
+            with patch.object(sys, "path", list(sys.path)):
+                _ensure_chipflow_root()
+            with patch.object(sys, "path", list(sys.path)):
+                self.assertNotIn(chipflow_root, sys.path)
+                self.assertEqual(_ensure_chipflow_root(), chipflow_root)
+                self.assertIn(chipflow_root, sys.path)
+
+
+class ParseConfigFileTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.tmp_dir, "chipflow.toml")
+        shutil.copy(f"{current_dir}/fixtures/chipflow-flexic.toml", self.config_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_schema_is_valid(self):
+        jsonschema.Draft202012Validator.check_schema(config_schema)
+
+    def test_parses_config(self):
+        config = _parse_config_file(self.config_file)
+        self.assertEqual(config["chipflow"]["project_id"], 123)
+        self.assertEqual(config["chipflow"]["silicon"]["process"], "customer1")
+
+    def test_unchanged_config_is_cached(self):
+        config = _parse_config_file(self.config_file)
+        self.assertIs(_parse_config_file(self.config_file), config)
+
+    def test_modified_config_is_reparsed(self):
+        config = _parse_config_file(self.config_file)
+        with open(self.config_file, "a") as f:
+            f.write("\n[chipflow.silicon.pads.extra]\ntype = \"o\"\nloc = \"N8\"\n")
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        new_config = _parse_config_file(self.config_file)
+        self.assertIsNot(new_config, config)
+        self.assertIn("extra", new_config["chipflow"]["silicon"]["pads"])
+
+    def test_same_mtime_different_size_is_reparsed(self):
+        config = _parse_config_file(self.config_file)
+        stat = os.stat(self.config_file)
+        with open(self.config_file, "a") as f:
+            f.write("\n[chipflow.silicon.pads.extra]\ntype = \"o\"\nloc = \"N8\"\n")
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        new_config = _parse_config_file(self.config_file)
+        self.assertIn("extra", new_config["chipflow"]["silicon"]["pads"])
+
+    def test_relative_path_shares_cache_entry(self):
+        config = _parse_config_file(self.config_file)
+        cwd = os.getcwd()
+        os.chdir(self.tmp_dir)
+        try:
+            self.assertIs(_parse_config_file("chipflow.toml"), config)
+        finally:
+            os.chdir(cwd)
+
+    def test_touched_config_is_not_reparsed(self):
+        config = _parse_config_file(self.config_file)
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertIs(_parse_config_file(self.config_file), config)
+
+    def test_cached_config_does_not_import_parsers(self):
+        with patch.dict(os.environ, {"CHIPFLOW_ROOT": self.tmp_dir}), \
+                patch.object(sys, "path", list(sys.path)):
+            config = _parse_config()
+            with patch.dict(sys.modules, {"jsonschema": None, "tomllib": None, "tomli": None}):
+                self.assertEqual(_parse_config(), config)
+
+    def test_config_cached_across_invocations(self):
+        with patch.dict(os.environ, {"CHIPFLOW_ROOT": self.tmp_dir}), \
+                patch.object(sys, "path", list(sys.path)):
+            config = _parse_config()
+            self.assertTrue(os.path.exists(os.path.join(self.tmp_dir, "build", "chipflow.toml.pickle")))
+
+            with patch("chipflow_lib.cli._parse_config_file") as mock_parse_config_file:
+                self.assertEqual(_parse_config(), config)
+            mock_parse_config_file.assert_not_called()
+
+            with open(self.config_file, "a") as f:
+                f.write("\n[chipflow.silicon.pads.extra]\ntype = \"o\"\nloc = \"N8\"\n")
+            self.assertIn("extra", _parse_config()["chipflow"]["silicon"]["pads"])
+
+    def test_invalid_config(self):
+        with open(self.config_file, "w") as f:
+            f.write("[chipflow]\nsteps = {}\n")
+        with self.assertRaisesRegex(
+                ChipFlowError,
+                r"^Syntax error in `chipflow.toml` at `chipflow`: 'silicon' is a required property$"):
+            _parse_config_file(self.config_file)
+
+
+class RunTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        MockStep.runs.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def run_cli(self, argv, steps):
+        with open(f"{current_dir}/fixtures/chipflow-flexic.toml") as f:
+            config = f.read()
+        config = config.replace(
+            'silicon = "thermostat.steps.silicon:MySiliconStep"',
+            "\n".join(f'{step_name} = "{step_reference}"' for step_name, step_reference in steps.items()))
+        with open(os.path.join(self.tmp_dir, "chipflow.toml"), "w") as f:
+            f.write(config)
+
+        with patch.dict(os.environ, {"CHIPFLOW_ROOT": self.tmp_dir}), \
+                patch.object(sys, "path", list(sys.path)):
+            run(argv)
+
+    def test_only_requested_step_is_loaded(self):
+        self.run_cli(["mock", "--flag"], steps={
+            "mock": f"{__name__}:MockStep",
+            "broken": "chipflow_lib.nonexistent:Step",
+        })
+        self.assertEqual(len(MockStep.runs), 1)
+        self.assertEqual(MockStep.runs[0].step, "mock")
+        self.assertTrue(MockStep.runs[0].flag)
+
+    def test_unknown_step_resolves_all_steps(self):
+        with self.assertRaisesRegex(
+                ChipFlowError,
+                r"^Module `chipflow_lib.nonexistent` referenced by step `broken` is not found$"):
+            self.run_cli(["unknown"], steps={
+                "mock": f"{__name__}:MockStep",
+                "broken": "chipflow_lib.nonexistent:Step",
+            })
+
+    def test_help_does_not_initialize_steps(self):
+        output = io.StringIO()
+        with patch.object(MockStep, "__init__", side_effect=Exception), \
+                redirect_stdout(output), \
+                self.assertRaises(SystemExit) as exit_cm:
+            self.run_cli(["--help"], steps={"mock": f"{__name__}:MockStep"})
+        self.assertEqual(exit_cm.exception.code, 0)
+        self.assertIn("Run the mock step.", output.getvalue())
@@ -2,8 +2,11 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 import os
+import tempfile
+import subprocess
 
 import unittest
+from unittest.mock import patch
 from amaranth import *
 from amaranth.hdl import Fragment
 from amaranth.hdl._ir import Design
@@ -38,3 +41,61 @@ class SiliconPlatformTestCase(unittest.TestCase):
                 ChipFlowError,
                 r"^Only a single clock domain, called 'sync', may be used$"):
             SiliconPlatform(pads={}).build(m)
+
+    @patch("subprocess.check_call")
+    def test_build_skips_unchanged_design(self, mock_check_call):
+        mock_check_call.side_effect = self.fake_yosys("fake-rtlil")
+
+        with tempfile.TemporaryDirectory() as chipflow_root, \
+                patch.dict(os.environ, {"CHIPFLOW_ROOT": chipflow_root}):
+            m = Module()
+            SiliconPlatform(pads={}).build(m)
+            SiliconPlatform(pads={}).build(m)
+            self.assertEqual(mock_check_call.call_count, 1)
+
+            platform = SiliconPlatform(pads={})
+            platform.add_file("extra.v", "module extra; endmodule")
+            platform.build(m)
+            self.assertEqual(mock_check_call.call_count, 2)
+
+    @patch("subprocess.check_call")
+    def test_build_forced_rebuild(self, mock_check_call):
+        mock_check_call.side_effect = self.fake_yosys("fake-rtlil")
+
+        with tempfile.TemporaryDirectory() as chipflow_root, \
+                patch.dict(os.environ, {"CHIPFLOW_ROOT": chipflow_root}):
+            m = Module()
+            SiliconPlatform(pads={}).build(m)
+            with patch.dict(os.environ, {"CHIPFLOW_FORCE_REBUILD": "1"}):
+                SiliconPlatform(pads={}).build(m)
+            self.assertEqual(mock_check_call.call_count, 2)
+
+    @patch("subprocess.check_call")
+    def test_build_after_failed_build_reruns(self, mock_check_call):
+        with tempfile.TemporaryDirectory() as chipflow_root, \
+                patch.dict(os.environ, {"CHIPFLOW_ROOT": chipflow_root}):
+            m = Module()
+            mock_check_call.side_effect = self.fake_yosys("rtlil-a")
+            output_rtlil = SiliconPlatform(pads={}).build(m)
+
+            def failing_yosys(args):
+                self.fake_yosys("partial-b")(args)
+                raise subprocess.CalledProcessError(1, args)
+            mock_check_call.side_effect = failing_yosys
+            platform = SiliconPlatform(pads={})
+            platform.add_file("extra.v", "module extra; endmodule")
+            with self.assertRaises(subprocess.CalledProcessError):
+                platform.build(m)
+
+            mock_check_call.side_effect = self.fake_yosys("rtlil-a")
+            SiliconPlatform(pads={}).build(m)
+            self.assertEqual(mock_check_call.call_count, 3)
+            with open(output_rtlil) as f:
+                self.assertEqual(f.read(), "rtlil-a")
+
+    @staticmethod
+    def fake_yosys(output):
+        def run(args):
+            with open(args[-1], "w") as f:
+                f.write(output)
+        return run
@@ -3,13 +3,17 @@
 import io
 import json
 import os
-import tomli
 import unittest
 from contextlib import redirect_stdout
 from unittest.mock import patch
 
 from chipflow_lib.steps.silicon import SiliconStep
 
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
 
 current_dir = os.path.dirname(__file__)
 
@@ -45,7 +49,7 @@ class SiliconStepTestCase(unittest.TestCase):
     def test_submit_happy_path(self, mock_requests_post):
         customer_config = f"{current_dir}/fixtures/chipflow-flexic.toml"
         with open(customer_config, "rb") as f:
-            config_dict = tomli.load(f)
+            config_dict = tomllib.load(f)
 
         silicon_step = SiliconStep(config_dict)
 